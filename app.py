@@ -4,37 +4,128 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
+import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import pytz
 import ta
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# Gunakan kernel Numba jika tersedia, jika tidak pakai pustaka ta
+try:
+    from indicators_nb import sma, ema, rsi, lttb
+    NUMBA_TERSEDIA = True
+except ImportError:
+    NUMBA_TERSEDIA = False
+
+# yfinance versi baru hanya menerima sesi curl_cffi, versi lama memakai requests
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_TERSEDIA = True
+except ImportError:
+    import requests
+    from requests.adapters import HTTPAdapter
+    CURL_CFFI_TERSEDIA = False
+
+# Panggil kernel sekali per proses agar kompilasi JIT tidak terjadi saat klik pertama
+@st.cache_resource(show_spinner=False)
+def _pemanasan_kernel():
+    """
+    Menjalankan setiap kernel Numba dengan data contoh supaya hasil kompilasinya siap dipakai
+    """
+    data_pemanasan = np.arange(100, dtype=np.float64)
+    sma(data_pemanasan, 20)
+    ema(data_pemanasan, 20)
+    rsi(data_pemanasan, 14)
+    lttb(data_pemanasan, 10)
+    return True
+
+if NUMBA_TERSEDIA:
+    _pemanasan_kernel()
 
 # Konstanta kurs USD ke IDR (bisa diupdate secara real-time)
 KURS_USD_IDR = 15700  # Default rate, akan diupdate secara otomatis
 
+# Pemetaan nama indikator ke nama kolom pada data
+KOLOM_INDIKATOR = {
+    'SMA 20': 'SMA_20',
+    'SMA 50': 'SMA_50',
+    'EMA 20': 'EMA_20',
+    'EMA 50': 'EMA_50',
+    'RSI': 'RSI'
+}
+
+# Interval pembaruan panel harga real-time (detik)
+INTERVAL_HARGA_REALTIME = 30
+
+# Batas jumlah titik pada grafik, data yang lebih panjang akan diperkecil
+# Candlestick digabung per bucket, grafik garis dan area memakai LTTB
+BATAS_TITIK_GRAFIK = 2000
+JUMLAH_TITIK_GRAFIK = 1500
+
 ##########################################################################################
 ## BAGIAN 1: Fungsi-fungsi untuk Mengambil dan Memproses Data Saham ##
 ##########################################################################################
 
+# Membuat sesi HTTP bersama untuk semua unduhan
+@st.cache_resource(show_spinner=False)
+def buat_sesi_http():
+    """
+    Membuat satu sesi HTTP yang dipakai ulang agar koneksi TCP/TLS ke Yahoo Finance tidak dibuka ulang
+    """
+    if CURL_CFFI_TERSEDIA:
+        return curl_requests.Session(impersonate="chrome")
+    
+    sesi = requests.Session()
+    sesi.headers.update({'User-Agent': 'Mozilla/5.0'})
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    sesi.mount('https://', adapter)
+    sesi.mount('http://', adapter)
+    return sesi
+
 # Fungsi untuk mendapatkan kurs USD/IDR terkini
-@st.cache_data(ttl=300)  # Cache selama 5 menit
+@st.cache_data(persist="disk", show_spinner=False)  # Disimpan ke disk, kedaluwarsa 5 menit diatur di kurs_terkini
 def ambil_kurs_usd_idr():
     """
     Mengambil kurs USD/IDR real-time dari Yahoo Finance
+    Mengembalikan tuple (kurs, waktu_pengambilan)
     """
     try:
-        kurs_data = yf.download('IDR=X', period='1d', interval='1m', progress=False)
+        kurs_data = yf.download('IDR=X', period='1d', interval='1m', auto_adjust=True, multi_level_index=False, progress=False, session=buat_sesi_http())
         if not kurs_data.empty:
-            if isinstance(kurs_data.columns, pd.MultiIndex):
-                kurs_data.columns = kurs_data.columns.get_level_values(0)
-            return kurs_data['Close'].iloc[-1]
+            return float(kurs_data['Close'].iloc[-1]), datetime.now()
         else:
-            return KURS_USD_IDR  # fallback ke default
-    except:
-        return KURS_USD_IDR  # fallback ke default
+            return KURS_USD_IDR, datetime.now()  # fallback ke default
+    except Exception:
+        return KURS_USD_IDR, datetime.now()  # fallback ke default
+
+# Mengambil kurs dan memperbarui cache jika sudah kedaluwarsa
+def kurs_terkini():
+    """
+    Mengembalikan kurs USD/IDR dari cache, diambil ulang jika lebih dari 5 menit
+    """
+    kurs, waktu = ambil_kurs_usd_idr()
+    
+    # Cache di disk tidak mengenal TTL, jadi periksa umur kurs secara manual
+    if datetime.now() - waktu > timedelta(minutes=5):
+        ambil_kurs_usd_idr.clear()
+        kurs, waktu = ambil_kurs_usd_idr()
+    
+    return kurs
+
+# Menjalankan fungsi di thread pekerja dengan konteks skrip Streamlit
+def jalankan_dengan_konteks(ctx, fungsi, *args):
+    """
+    Menempelkan ScriptRunContext ke thread saat ini sebelum memanggil fungsi
+    Agar fungsi ber-cache Streamlit tidak memberi peringatan "missing ScriptRunContext"
+    """
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return fungsi(*args)
 
 # Mengambil data saham dari Yahoo Finance
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)  # Cache selama 1 menit
 def ambil_data_saham(simbol, periode, interval):
     """
     Fungsi untuk mengunduh data historis saham
@@ -47,21 +138,43 @@ def ambil_data_saham(simbol, periode, interval):
     
     if periode == '1minggu':
         tanggal_awal = tanggal_akhir - timedelta(days=7)
-        data_saham = yf.download(simbol, start=tanggal_awal, end=tanggal_akhir, interval=interval, progress=False)
+        data_saham = yf.download(simbol, start=tanggal_awal, end=tanggal_akhir, interval=interval, auto_adjust=True, multi_level_index=False, progress=False, session=buat_sesi_http())
     else:
-        data_saham = yf.download(simbol, period=periode, interval=interval, progress=False)
+        data_saham = yf.download(simbol, period=periode, interval=interval, auto_adjust=True, multi_level_index=False, progress=False, session=buat_sesi_http())
+    
+    return data_saham
+
+# Mengambil data beberapa saham sekaligus dalam satu permintaan
+# TTL sedikit di bawah interval fragment, karena umur cache dihitung sejak unduhan selesai
+# sehingga dengan TTL yang sama persis setiap tick kedua masih membaca cache lama
+@st.cache_data(ttl=INTERVAL_HARGA_REALTIME - 5, show_spinner=False)
+def ambil_data_banyak_saham(simbols, periode, interval):
+    """
+    Fungsi untuk mengunduh data historis beberapa saham sekaligus
+    Parameter:
+        simbols: tuple kode ticker saham
+        periode: rentang waktu data
+        interval: interval waktu per data point
+    """
+    data_saham = yf.download(
+        " ".join(simbols),
+        period=periode,
+        interval=interval,
+        group_by='ticker',
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+        session=buat_sesi_http()
+    )
     
     return data_saham
 
 # Memproses dan membersihkan data
+@st.cache_data(ttl=60, show_spinner=False)
 def olah_data(df):
     """
     Mengkonversi data ke timezone yang sesuai dan format yang benar
     """
-    # Flatten multi-level columns if they exist
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-    
     # Ensure we have the right columns
     df = df[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
     
@@ -84,24 +197,35 @@ def olah_data(df):
     
     return df
 
+# Versi ringan olah_data untuk panel samping
+def olah_data_lite(df):
+    """
+    Mengambil harga terakhir dan harga pembukaan dari data mentah
+    Tanpa menyalin data, mengkonversi timezone, atau mengganti nama kolom
+    """
+    return df['Close'].iloc[-1], df['Open'].iloc[0]
+
 # Menghitung metrik penting
 def hitung_metrik(df, kurs):
     """
     Menghitung statistik dasar dari data saham dalam USD dan IDR
     """
-    harga_terakhir_usd = df['Penutupan'].iloc[-1]
-    harga_awal_usd = df['Penutupan'].iloc[0]
+    # Ambil kolom yang dibutuhkan sekali sebagai array NumPy
+    arr = df[['Penutupan', 'Tertinggi', 'Terendah', 'Volume']].to_numpy(dtype=np.float64)
+    penutupan = arr[:, 0]
+    
+    harga_terakhir_usd = penutupan[-1]
+    harga_awal_usd = penutupan[0]
     perubahan_usd = harga_terakhir_usd - harga_awal_usd
     perubahan_persen = (perubahan_usd / harga_awal_usd) * 100
-    harga_tertinggi_usd = df['Tertinggi'].max()
-    harga_terendah_usd = df['Terendah'].min()
-    total_volume = df['Volume'].sum()
+    harga_tertinggi_usd = np.nanmax(arr[:, 1])
+    harga_terendah_usd = np.nanmin(arr[:, 2])
+    total_volume = np.nansum(arr[:, 3])
     
-    # Konversi ke IDR
-    harga_terakhir_idr = harga_terakhir_usd * kurs
-    perubahan_idr = perubahan_usd * kurs
-    harga_tertinggi_idr = harga_tertinggi_usd * kurs
-    harga_terendah_idr = harga_terendah_usd * kurs
+    # Konversi ke IDR sekaligus
+    harga_terakhir_idr, perubahan_idr, harga_tertinggi_idr, harga_terendah_idr = np.multiply(
+        [harga_terakhir_usd, perubahan_usd, harga_tertinggi_usd, harga_terendah_usd], kurs
+    )
     
     return {
         'harga_terakhir_usd': harga_terakhir_usd,
@@ -117,28 +241,176 @@ def hitung_metrik(df, kurs):
     }
 
 # Menambahkan indikator teknikal
-def tambah_indikator(df):
+@st.cache_data(ttl=60, show_spinner=False)
+def tambah_indikator(df, indikator):
     """
     Menambahkan indikator teknikal seperti SMA dan EMA
+    Parameter:
+        df: data saham yang sudah diolah
+        indikator: tuple indikator yang dipilih, hanya ini yang dihitung
     """
     # Make sure we're working with a clean copy
     df = df.copy()
     
-    # Ensure Penutupan column is a Series, not DataFrame
-    harga_penutupan = df['Penutupan'].squeeze()
+    if NUMBA_TERSEDIA:
+        # Ambil array harga penutupan sekali untuk semua kernel
+        arr = df['Penutupan'].to_numpy(dtype=np.float64)
+        
+        perhitungan = {
+            'SMA 20': lambda: sma(arr, 20),
+            'SMA 50': lambda: sma(arr, 50),
+            'EMA 20': lambda: ema(arr, 20),
+            'EMA 50': lambda: ema(arr, 50),
+            'RSI': lambda: rsi(arr, 14)
+        }
+    else:
+        # Ensure Penutupan column is a Series, not DataFrame
+        harga_penutupan = df['Penutupan'].squeeze()
+        
+        perhitungan = {
+            'SMA 20': lambda: harga_penutupan.rolling(20).mean(),
+            'SMA 50': lambda: harga_penutupan.rolling(50).mean(),
+            'EMA 20': lambda: harga_penutupan.ewm(span=20, min_periods=20, adjust=False).mean(),
+            'EMA 50': lambda: harga_penutupan.ewm(span=50, min_periods=50, adjust=False).mean(),
+            'RSI': lambda: ta.momentum.rsi(harga_penutupan, window=14)
+        }
+    
+    # Nama kolom diambil dari KOLOM_INDIKATOR, hanya indikator yang dipilih yang dihitung
+    for nama, kolom in KOLOM_INDIKATOR.items():
+        if nama in indikator:
+            df[kolom] = perhitungan[nama]()
+    
+    return df
+
+# Menggabungkan candle agar jumlahnya sesuai batas grafik
+def agregasi_ohlc(df, n_keluar):
+    """
+    Menggabungkan baris berurutan menjadi n_keluar candle
+    Pembukaan pertama, tertinggi maksimum, terendah minimum, dan penutupan terakhir di setiap bucket
+    Sehingga harga tertinggi dan terendah pada grafik tetap sama dengan metrik
+    """
+    bucket = np.arange(len(df)) * n_keluar // len(df)
+    
+    # Tanggal dan indikator mengikuti awal bucket, sesuai posisi candle
+    aturan = {kolom: 'first' for kolom in df.columns}
+    aturan.update({
+        'Tertinggi': 'max',
+        'Terendah': 'min',
+        'Penutupan': 'last',
+        'Volume': 'sum'
+    })
     
-    # Simple Moving Average
-    df['SMA_20'] = ta.trend.sma_indicator(harga_penutupan, window=20)
-    df['SMA_50'] = ta.trend.sma_indicator(harga_penutupan, window=50)
+    return df.groupby(bucket).agg(aturan)
+
+# Membuat grafik harga dan grafik RSI
+@st.cache_data(max_entries=16, show_spinner=False)
+def buat_grafik(data, tipe_grafik, indikator):
+    """
+    Membuat grafik harga beserta indikatornya, dan grafik RSI jika dipilih
+    Parameter:
+        data: data saham yang sudah diberi indikator
+        tipe_grafik: 'Candlestick', 'Garis', atau 'Area'
+        indikator: tuple indikator yang dipilih
+    Mengembalikan tuple (grafik, grafik_rsi), grafik_rsi bernilai None jika RSI tidak dipilih
+    """
+    # Perkecil data yang terlalu panjang sebelum digambar
+    if len(data) > BATAS_TITIK_GRAFIK and tipe_grafik == 'Candlestick':
+        data_grafik = agregasi_ohlc(data, JUMLAH_TITIK_GRAFIK)
+    elif len(data) > BATAS_TITIK_GRAFIK and NUMBA_TERSEDIA:
+        data_grafik = data.iloc[lttb(data['Penutupan'].to_numpy(dtype=np.float64), JUMLAH_TITIK_GRAFIK)]
+    else:
+        data_grafik = data
     
-    # Exponential Moving Average
-    df['EMA_20'] = ta.trend.ema_indicator(harga_penutupan, window=20)
-    df['EMA_50'] = ta.trend.ema_indicator(harga_penutupan, window=50)
+    # Konversi kolom sekali ke array NumPy (tanpa zona waktu agar serialisasi cepat)
+    # Harga dikirim sebagai float32 hanya untuk grafik, perhitungan tetap memakai float64
+    tanggal = data_grafik['Tanggal'].dt.tz_localize(None).to_numpy()
+    penutupan = data_grafik['Penutupan'].to_numpy(dtype=np.float32)
     
-    # RSI
-    df['RSI'] = ta.momentum.rsi(harga_penutupan, window=14)
+    # Kumpulkan trace sebagai dict biasa, lalu buat figure sekali
+    daftar_trace = []
     
-    return df
+    # Pilih tipe grafik
+    if tipe_grafik == 'Candlestick':
+        daftar_trace.append({
+            'type': 'candlestick',
+            'x': tanggal,
+            'open': data_grafik['Pembukaan'].to_numpy(dtype=np.float32),
+            'high': data_grafik['Tertinggi'].to_numpy(dtype=np.float32),
+            'low': data_grafik['Terendah'].to_numpy(dtype=np.float32),
+            'close': penutupan,
+            'name': 'Harga'
+        })
+    elif tipe_grafik == 'Garis':
+        daftar_trace.append({
+            'type': 'scatter',
+            'x': tanggal,
+            'y': penutupan,
+            'mode': 'lines',
+            'name': 'Harga Penutupan',
+            'line': {'color': '#1f77b4', 'width': 2}
+        })
+    else:  # Area
+        daftar_trace.append({
+            'type': 'scatter',
+            'x': tanggal,
+            'y': penutupan,
+            'fill': 'tozeroy',
+            'name': 'Harga Penutupan',
+            'line': {'color': '#1f77b4'}
+        })
+    
+    # Tambahkan indikator teknikal yang dipilih: nama -> (gaya garis, warna)
+    # Kolom data diambil dari KOLOM_INDIKATOR
+    gaya_indikator = {
+        'SMA 20': ('dash', '#ff7f0e'),
+        'SMA 50': ('dash', '#2ca02c'),
+        'EMA 20': ('dot', '#d62728'),
+        'EMA 50': ('dot', '#9467bd')
+    }
+    
+    for nama in indikator:
+        if nama in gaya_indikator:
+            kolom = KOLOM_INDIKATOR[nama]
+            gaya_garis, warna = gaya_indikator[nama]
+            daftar_trace.append({
+                'type': 'scatter',
+                'x': tanggal,
+                'y': data_grafik[kolom].to_numpy(dtype=np.float32),
+                'name': nama,
+                'line': {'color': warna, 'dash': gaya_garis}
+            })
+    
+    # Buat grafik beserta formatnya dalam satu langkah
+    grafik = go.Figure(
+        data=daftar_trace,
+        layout={
+            'xaxis': {'title': {'text': 'Waktu'}},
+            'yaxis': {'title': {'text': 'Harga (USD)'}},
+            'height': 600,
+            'hovermode': 'x unified',
+            'template': 'plotly_white'
+        }
+    )
+    
+    # Grafik RSI jika dipilih
+    grafik_rsi = None
+    if 'RSI' in indikator:
+        grafik_rsi = go.Figure(data=[{
+            'type': 'scatter',
+            'x': tanggal,
+            'y': data_grafik[KOLOM_INDIKATOR['RSI']].to_numpy(dtype=np.float32),
+            'name': 'RSI',
+            'line': {'color': 'purple'}
+        }], layout={
+            'xaxis': {'title': {'text': 'Waktu'}},
+            'yaxis': {'title': {'text': 'RSI'}},
+            'height': 300,
+            'template': 'plotly_white'
+        })
+        grafik_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
+        grafik_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
+    
+    return grafik, grafik_rsi
 
 ###############################################
 ## BAGIAN 2: Membuat Tampilan Dashboard ##
@@ -207,17 +479,21 @@ st.sidebar.markdown('---')
 if st.sidebar.button('🔄 Perbarui Data', type='primary', use_container_width=True):
     
     with st.spinner(f'Mengambil data untuk {kode_saham}...'):
-        # Ambil kurs USD/IDR
-        kurs_idr = ambil_kurs_usd_idr()
-        
-        # Ambil dan proses data
-        data = ambil_data_saham(kode_saham, periode_waktu, pemetaan_interval[periode_waktu])
+        # Ambil kurs USD/IDR dan data saham secara bersamaan
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=2) as eksekutor:
+            future_kurs = eksekutor.submit(jalankan_dengan_konteks, ctx, kurs_terkini)
+            future_data = eksekutor.submit(
+                jalankan_dengan_konteks, ctx,
+                ambil_data_saham, kode_saham, periode_waktu, pemetaan_interval[periode_waktu]
+            )
+            kurs_idr, data = future_kurs.result(), future_data.result()
         
         if data.empty:
             st.error('❌ Data tidak ditemukan. Pastikan kode saham benar.')
         else:
             data = olah_data(data)
-            data = tambah_indikator(data)
+            data = tambah_indikator(data, tuple(indikator_teknikal))
             
             # Hitung metrik
             metrik = hitung_metrik(data, kurs_idr)
@@ -278,122 +554,43 @@ if st.sidebar.button('🔄 Perbarui Data', type='primary', use_container_width=T
             # Buat grafik harga saham
             st.subheader(f'Grafik Harga {kode_saham.upper()}')
             
-            grafik = go.Figure()
-            
-            # Pilih tipe grafik
-            if tipe_grafik == 'Candlestick':
-                grafik.add_trace(go.Candlestick(
-                    x=data['Tanggal'],
-                    open=data['Pembukaan'],
-                    high=data['Tertinggi'],
-                    low=data['Terendah'],
-                    close=data['Penutupan'],
-                    name='Harga'
-                ))
-            elif tipe_grafik == 'Garis':
-                grafik.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['Penutupan'],
-                    mode='lines',
-                    name='Harga Penutupan',
-                    line=dict(color='#1f77b4', width=2)
-                ))
-            else:  # Area
-                grafik.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['Penutupan'],
-                    fill='tozeroy',
-                    name='Harga Penutupan',
-                    line=dict(color='#1f77b4')
-                ))
-            
-            # Tambahkan indikator teknikal yang dipilih
-            warna_indikator = {
-                'SMA 20': '#ff7f0e',
-                'SMA 50': '#2ca02c',
-                'EMA 20': '#d62728',
-                'EMA 50': '#9467bd'
-            }
-            
-            for indikator in indikator_teknikal:
-                if indikator == 'SMA 20':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['SMA_20'], 
-                        name='SMA 20',
-                        line=dict(color=warna_indikator['SMA 20'], dash='dash')
-                    ))
-                elif indikator == 'SMA 50':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['SMA_50'], 
-                        name='SMA 50',
-                        line=dict(color=warna_indikator['SMA 50'], dash='dash')
-                    ))
-                elif indikator == 'EMA 20':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['EMA_20'], 
-                        name='EMA 20',
-                        line=dict(color=warna_indikator['EMA 20'], dash='dot')
-                    ))
-                elif indikator == 'EMA 50':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['EMA_50'], 
-                        name='EMA 50',
-                        line=dict(color=warna_indikator['EMA 50'], dash='dot')
-                    ))
-            
-            # Format grafik
-            grafik.update_layout(
-                xaxis_title='Waktu',
-                yaxis_title='Harga (USD)',
-                height=600,
-                hovermode='x unified',
-                template='plotly_white'
-            )
+            grafik, grafik_rsi = buat_grafik(data, tipe_grafik, tuple(indikator_teknikal))
             
             st.plotly_chart(grafik, use_container_width=True)
             
             # Grafik RSI jika dipilih
-            if 'RSI' in indikator_teknikal:
+            if grafik_rsi is not None:
                 st.subheader('RSI (Relative Strength Index)')
-                grafik_rsi = go.Figure()
-                grafik_rsi.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['RSI'],
-                    name='RSI',
-                    line=dict(color='purple')
-                ))
-                grafik_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
-                grafik_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
-                grafik_rsi.update_layout(
-                    xaxis_title='Waktu',
-                    yaxis_title='RSI',
-                    height=300,
-                    template='plotly_white'
-                )
                 st.plotly_chart(grafik_rsi, use_container_width=True)
             
             st.markdown('---')
             
             # Tampilkan data dalam tabel
-            tab1, tab2 = st.tabs(['📋 Data Historis', '📊 Indikator Teknikal'])
+            data_terakhir = data.tail(50)
             
-            with tab1:
-                st.dataframe(
-                    data[['Tanggal', 'Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan', 'Volume']].tail(50),
-                    use_container_width=True
-                )
+            # Kolom indikator hanya untuk indikator yang dipilih pengguna
+            kolom_indikator = ['Tanggal'] + [
+                kolom for nama, kolom in KOLOM_INDIKATOR.items() if nama in indikator_teknikal
+            ]
+            
+            # Tab indikator hanya ditampilkan jika ada indikator yang dipilih
+            nama_tab = ['📋 Data Historis']
+            if len(kolom_indikator) > 1:
+                nama_tab.append('📊 Indikator Teknikal')
+            daftar_tab = st.tabs(nama_tab)
             
-            with tab2:
-                kolom_indikator = ['Tanggal', 'SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'RSI']
-                kolom_tersedia = [k for k in kolom_indikator if k in data.columns]
+            with daftar_tab[0]:
                 st.dataframe(
-                    data[kolom_tersedia].tail(50),
+                    data_terakhir[['Tanggal', 'Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan', 'Volume']],
                     use_container_width=True
                 )
+            
+            if len(daftar_tab) > 1:
+                with daftar_tab[1]:
+                    st.dataframe(
+                        data_terakhir[kolom_indikator],
+                        use_container_width=True
+                    )
 
 else:
     # Tampilan awal sebelum data dimuat
@@ -417,37 +614,56 @@ else:
 # 2C: PANEL SAMPING - HARGA REAL-TIME ############
 
 st.sidebar.markdown('---')
-st.sidebar.subheader('💹 Harga Saham Real-Time')
 
-# Ambil kurs untuk sidebar
-kurs_sidebar = ambil_kurs_usd_idr()
+daftar_saham = ('AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA')
 
-daftar_saham = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA']
-
-for simbol in daftar_saham:
+# Fragment diperbarui sendiri setiap 30 detik tanpa menjalankan ulang seluruh halaman
+@st.fragment(run_every=INTERVAL_HARGA_REALTIME)
+def tampilkan_harga_realtime():
+    """
+    Menampilkan harga terkini saham-saham di daftar_saham dalam USD dan IDR
+    """
+    st.subheader('💹 Harga Saham Real-Time')
+    
+    # Ambil kurs untuk sidebar
+    kurs_sidebar = kurs_terkini()
+    
+    # Ambil data semua saham dalam satu permintaan
     try:
-        data_realtime = ambil_data_saham(simbol, '1d', '5m')
-        if not data_realtime.empty:
-            data_realtime = olah_data(data_realtime)
-            harga_sekarang = data_realtime['Penutupan'].iloc[-1]
-            harga_buka = data_realtime['Pembukaan'].iloc[0]
-            selisih = harga_sekarang - harga_buka
-            persen_selisih = (selisih / harga_buka) * 100
-            
-            # Konversi ke IDR
-            harga_sekarang_idr = harga_sekarang * kurs_sidebar
-            
-            # Format delta without dollar sign so Streamlit can detect sign
-            delta_text = f"{selisih:.2f} ({persen_selisih:.2f}%)"
-            
-            st.sidebar.metric(
-                f"{simbol}", 
-                f"${harga_sekarang:.2f} / Rp {harga_sekarang_idr:,.0f}",
-                delta_text,
-                delta_color="normal"
-            )
-    except:
-        st.sidebar.text(f"{simbol}: Data tidak tersedia")
+        data_semua_saham = ambil_data_banyak_saham(daftar_saham, '1d', '5m')
+    except Exception:
+        data_semua_saham = None  # semua saham ditampilkan sebagai tidak tersedia
+    
+    for simbol in daftar_saham:
+        if data_semua_saham is None:
+            st.text(f"{simbol}: Data tidak tersedia")
+            continue
+        
+        try:
+            data_realtime = data_semua_saham[simbol].dropna(how='all')
+            if not data_realtime.empty:
+                harga_sekarang, harga_buka = olah_data_lite(data_realtime)
+                selisih = harga_sekarang - harga_buka
+                persen_selisih = (selisih / harga_buka) * 100
+                
+                # Konversi ke IDR
+                harga_sekarang_idr = harga_sekarang * kurs_sidebar
+                
+                # Format delta without dollar sign so Streamlit can detect sign
+                delta_text = f"{selisih:.2f} ({persen_selisih:.2f}%)"
+                
+                st.metric(
+                    f"{simbol}", 
+                    f"${harga_sekarang:.2f} / Rp {harga_sekarang_idr:,.0f}",
+                    delta_text,
+                    delta_color="normal"
+                )
+        except:
+            st.text(f"{simbol}: Data tidak tersedia")
+
+# Fragment tidak bisa menulis ke st.sidebar secara langsung, jadi panggil di dalam konteks sidebar
+with st.sidebar:
+    tampilkan_harga_realtime()
 
 # Informasi tambahan
 st.sidebar.markdown('---')
@@ -0,0 +1,163 @@
+# Kernel berbasis Numba untuk indikator teknikal dan grafik
+# Versi cepat dari indikator SMA, EMA, dan RSI pada pustaka ta, serta LTTB untuk grafik
+
+import numpy as np
+from numba import njit
+
+# Simple Moving Average
+@njit(cache=True, nogil=True)
+def sma(a, w):
+    """
+    Menghitung SMA dengan jumlah berjalan dalam satu kali lintasan
+    Nilai NaN dilewati, hasil hanya diisi jika seluruh w nilai di jendela valid
+    Parameter:
+        a: array harga (float64)
+        w: panjang jendela
+    """
+    n = a.shape[0]
+    hasil = np.full(n, np.nan)
+    jumlah = 0.0
+    jumlah_valid = 0
+
+    for i in range(n):
+        if not np.isnan(a[i]):
+            jumlah += a[i]
+            jumlah_valid += 1
+        if i >= w and not np.isnan(a[i - w]):
+            jumlah -= a[i - w]
+            jumlah_valid -= 1
+        if jumlah_valid == w:
+            hasil[i] = jumlah / w
+
+    return hasil
+
+# Exponential Moving Average
+@njit(cache=True, nogil=True)
+def ema(a, w):
+    """
+    Menghitung EMA (adjust=False) dalam satu kali lintasan
+    Nilai NaN dilewati seperti ewm pada pandas, hasil diisi setelah w nilai valid
+    Parameter:
+        a: array harga (float64)
+        w: panjang jendela (span)
+    """
+    n = a.shape[0]
+    hasil = np.full(n, np.nan)
+
+    alpha = 2.0 / (w + 1.0)
+    nilai = np.nan
+    bobot_lama = 1.0
+    jumlah_valid = 0
+
+    for i in range(n):
+        valid = not np.isnan(a[i])
+        if valid:
+            jumlah_valid += 1
+
+        if np.isnan(nilai):
+            if valid:
+                nilai = a[i]
+        else:
+            # Bobot nilai lama tetap meluruh selama NaN, sama dengan ignore_na=False
+            bobot_lama *= 1.0 - alpha
+            if valid:
+                if nilai != a[i]:
+                    nilai = (bobot_lama * nilai + alpha * a[i]) / (bobot_lama + alpha)
+                bobot_lama = 1.0
+
+        if jumlah_valid >= w:
+            hasil[i] = nilai
+
+    return hasil
+
+# Relative Strength Index
+@njit(cache=True, nogil=True)
+def rsi(a, w):
+    """
+    Menghitung RSI dengan pemulusan Wilder dalam satu kali lintasan
+    Parameter:
+        a: array harga (float64)
+        w: panjang jendela
+    """
+    n = a.shape[0]
+    hasil = np.full(n, np.nan)
+    alpha = 1.0 / w
+    rata_naik = 0.0
+    rata_turun = 0.0
+
+    for i in range(n):
+        naik = 0.0
+        turun = 0.0
+        if i > 0:
+            # Selisih NaN dianggap 0, sama seperti pustaka ta
+            selisih = a[i] - a[i - 1]
+            if selisih > 0:
+                naik = selisih
+            elif selisih < 0:
+                turun = -selisih
+
+        if i == 0:
+            rata_naik = naik
+            rata_turun = turun
+        else:
+            rata_naik = alpha * naik + (1.0 - alpha) * rata_naik
+            rata_turun = alpha * turun + (1.0 - alpha) * rata_turun
+
+        if i >= w - 1:
+            if rata_turun == 0.0:
+                hasil[i] = 100.0
+            else:
+                hasil[i] = 100.0 - 100.0 / (1.0 + rata_naik / rata_turun)
+
+    return hasil
+
+# Largest-Triangle-Three-Buckets
+@njit(cache=True, nogil=True)
+def lttb(y, n_keluar):
+    """
+    Memilih indeks titik representatif dengan algoritma LTTB untuk grafik
+    Parameter:
+        y: array nilai yang menentukan bentuk grafik (float64)
+        n_keluar: jumlah titik yang dipertahankan
+    """
+    n = y.shape[0]
+    if n_keluar >= n or n_keluar < 3:
+        return np.arange(n)
+
+    indeks = np.empty(n_keluar, dtype=np.int64)
+    indeks[0] = 0
+    indeks[n_keluar - 1] = n - 1
+
+    # Titik pertama dan terakhir selalu dipertahankan, sisanya dibagi ke dalam bucket
+    lebar = (n - 2) / (n_keluar - 2)
+    a = 0
+
+    for i in range(n_keluar - 2):
+        awal = int(i * lebar) + 1
+        akhir = int((i + 1) * lebar) + 1
+
+        # Rata-rata bucket berikutnya sebagai titik ketiga segitiga
+        awal_berikut = akhir
+        akhir_berikut = min(int((i + 2) * lebar) + 1, n)
+        rata_x = 0.0
+        rata_y = 0.0
+        for j in range(awal_berikut, akhir_berikut):
+            rata_x += j
+            rata_y += y[j]
+        jumlah = akhir_berikut - awal_berikut
+        rata_x /= jumlah
+        rata_y /= jumlah
+
+        # Pilih titik dengan luas segitiga terbesar di bucket ini
+        luas_maks = -1.0
+        terpilih = awal
+        for j in range(awal, akhir):
+            luas = abs((a - rata_x) * (y[j] - y[a]) - (a - j) * (rata_y - y[a]))
+            if luas > luas_maks:
+                luas_maks = luas
+                terpilih = j
+
+        a = terpilih
+        indeks[i + 1] = a
+
+    return indeks